@@ -1,10 +1,18 @@
 import streamlit as st
+import hashlib
+import logging
 import random
+import re
+import threading
 import time
+from collections import deque
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import requests
-from bs4 import BeautifulSoup
-from exa_py import Exa
-from serpapi import GoogleSearch
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
 
 # --- CONFIGURATION & ASSETS ---
 st.set_page_config(
@@ -14,9 +22,15 @@ st.set_page_config(
     initial_sidebar_state="collapsed"
 )
 
+@st.cache_resource
+def load_logo():
+    """Reads the logo from disk once per process instead of on every rerun."""
+    with open("pitcrew-1.png", "rb") as f:
+        return f.read()
+
 # Load Branding
 try:
-    st.image("pitcrew-1.png", width=250)
+    st.image(load_logo(), width=250)
 except Exception:
     st.markdown("<h1>pitcrew</h1>", unsafe_allow_html=True)
 
@@ -24,9 +38,10 @@ st.markdown("### 🛡️ Automated Pre-Audit Intelligence Agent")
 st.markdown("*Live Digital Investigation Demo*")
 
 # --- SIMULATION ENGINE (30-40% Risk Probability) ---
-def simulate_internal_discovery():
+def simulate_internal_discovery(paced=True):
     """Simulates checking internal CRM and Document systems."""
-    time.sleep(1.5) # Simulate processing time
+    if paced:
+        time.sleep(1.5) # Simulate processing time
     
     # 35% Chance of finding an issue
     if random.random() < 0.35:
@@ -40,9 +55,10 @@ def simulate_internal_discovery():
     else:
         return {"status": "Clear", "color": "green", "detail": "✅ All mandatory internal documents present."}
 
-def simulate_regulatory_check():
+def simulate_regulatory_check(paced=True):
     """Simulates checking FINRA/IAPD/RegEd."""
-    time.sleep(1.2)
+    if paced:
+        time.sleep(1.2)
     
     # 30% Chance of finding an issue
     if random.random() < 0.30:
@@ -57,6 +73,144 @@ def simulate_regulatory_check():
         return {"status": "Clear", "color": "green", "detail": "✅ No active disclosures or license gaps found."}
 
 # --- REAL INTELLIGENCE ENGINE ---
+def hash_api_key(api_key):
+    """Short digest of an API key, so the raw key never lands in a cache key."""
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+SERPAPI_ENDPOINT = "https://serpapi.com/search.json"
+SERPAPI_FIELDS = "organic_results[].{title,link,snippet}"
+EXA_MAX_CHARACTERS = 50_000 # Exa truncates server-side; plenty for the keyword scan
+
+MAX_HTML_BYTES = 5 * 1024 * 1024 # Fallback crawl stops downloading past this
+
+# Masquerade as a real browser to avoid 403 blocks on the fallback crawl
+BROWSER_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36"
+}
+
+@st.cache_resource
+def get_http_session():
+    """One pooled HTTP session per process, so repeat calls skip the TCP/TLS handshake."""
+    session = requests.Session()
+    session.headers.update(BROWSER_HEADERS)
+    
+    # Pool per host for concurrent audits; retry transient gateway errors only.
+    # No connect/read retries: each would add a full timeout on an unresponsive host.
+    retries = Retry(total=2, connect=0, read=0, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=retries)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+# (calls, period in seconds) per API key for each upstream API; SerpApi's free tier allows ~1/s
+API_RATE_LIMITS = {"serpapi": (1, 1.0), "exa": (5, 1.0)}
+
+class RateLimiter:
+    """Thread-safe sliding-window limiter: at most `calls` requests per `period` seconds."""
+
+    def __init__(self, calls, period):
+        self.calls = calls
+        self.period = period
+        self._slots = deque() # Send times already handed out, oldest first
+        self._lock = threading.Lock()
+
+    def wait(self):
+        """Claims the next free send slot, sleeping until it arrives."""
+        with self._lock:
+            now = time.monotonic()
+            while self._slots and self._slots[0] <= now - self.period:
+                self._slots.popleft()
+            
+            slot = now
+            if len(self._slots) >= self.calls:
+                slot = max(now, self._slots[-self.calls] + self.period)
+            self._slots.append(slot)
+        
+        # Sleep outside the lock so other callers can queue up behind us
+        if slot > now:
+            time.sleep(slot - now)
+
+@st.cache_resource(max_entries=64) # Two APIs x recent keys; see get_exa's bound
+def get_rate_limiter(api, key_hash):
+    """One limiter per (upstream API, API key): quotas are per key, so users don't queue on each other."""
+    return RateLimiter(*API_RATE_LIMITS[api])
+
+@st.cache_resource(max_entries=32) # Bounded: typed-in keys mustn't pin clients forever
+def get_exa(key_hash, _api_key):
+    """One Exa client per API key, reused across reruns and sessions."""
+    from exa_py import Exa # Deferred: only needed once an audit actually runs
+    return Exa(_api_key)
+
+def serpapi_error_message(error):
+    """UI-safe SerpApi failure text, built from the status code and SerpApi's own "error" field."""
+    response = error.response
+    if response is None:
+        if isinstance(error, requests.exceptions.RetryError):
+            return "SerpApi unavailable (retries exhausted)"
+        if isinstance(error, requests.exceptions.Timeout):
+            return "SerpApi request timed out"
+        return "SerpApi request failed (connection error)"
+    
+    try:
+        detail = response.json().get("error")
+    except ValueError:
+        detail = None
+    message = f"SerpApi returned HTTP {response.status_code}"
+    return f"{message}: {detail}" if detail else message
+
+@st.cache_data(ttl=600, show_spinner=False)
+def cached_serp_search(query, num, oba_hosts_hash, key_hash, _api_key):
+    """
+    Cached SerpApi lookup. Only the organic result fields rendered by the
+    dashboard are kept, so cache entries stay small and picklable.
+    """
+    # Hit the REST endpoint over the shared session (the SDK can't take one).
+    # json_restrictor trims the payload server-side to just the organic fields,
+    # instead of shipping & parsing the knowledge graph, ads, images, etc.
+    params = {
+        "engine": "google", "q": query, "api_key": _api_key, "num": num,
+        "json_restrictor": SERPAPI_FIELDS,
+    }
+    get_rate_limiter("serpapi", key_hash).wait() # Throttle up front rather than eat 429s
+    try:
+        response = get_http_session().get(SERPAPI_ENDPOINT, params=params, timeout=15)
+        response.raise_for_status()
+        data = response.json()
+    except requests.RequestException as e:
+        # requests' messages embed the request URL, api_key included: never pass them on
+        raise RuntimeError(serpapi_error_message(e)) from None
+    # OBA screening is scored once here and cached with the results it belongs to
+    return {
+        "organic_results": [
+            {
+                "title": res.get("title"), "link": res.get("link", ""), "snippet": res.get("snippet"),
+                "oba_check": needs_oba_check(res.get("link", "")),
+            }
+            for res in data.get("organic_results", [])[:num]
+        ]
+    }
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def cached_exa_contents(urls, key_hash, _api_key):
+    """
+    Cached Exa fetch for a tuple of URLs, sent as ONE get_contents request
+    instead of a round-trip per page. Returns [{"url", "text"}, ...].
+    """
+    exa = get_exa(key_hash, _api_key)
+    get_rate_limiter("exa", key_hash).wait()
+    response = exa.get_contents(list(urls), text={"max_characters": EXA_MAX_CHARACTERS}) # exa-py 2.x: urls is positional
+    return [{"url": res.url, "text": res.text} for res in response.results]
+
+# Profile sites whose listings must be matched against CRM OBA records
+OBA_HOSTS = frozenset(("linkedin.com",))
+# Part of the search cache key, so editing the OBA hosts invalidates cached flags
+OBA_HOSTS_HASH = hashlib.blake2b(repr(sorted(OBA_HOSTS)).encode(), digest_size=8).hexdigest()
+
+def needs_oba_check(link):
+    """True when a result links to a profile site in OBA_HOSTS (subdomains included)."""
+    host = urlparse(link).hostname or "" # Lowercased, without port or userinfo
+    return ".".join(host.rsplit(".", 2)[-2:]) in OBA_HOSTS
+
 def run_google_test(name, city, api_key):
     """Executes the 'Google Test' via SerpApi."""
     if not api_key:
@@ -64,15 +218,58 @@ def run_google_test(name, city, api_key):
         
     try:
         query = f"{name} financial advisor {city}"
-        search = GoogleSearch({"q": query, "api_key": api_key, "num": 5})
-        return search.get_dict(), None
+        return cached_serp_search(query, 5, OBA_HOSTS_HASH, hash_api_key(api_key), api_key), None
     except Exception as e:
         return None, str(e)
 
+def extract_text(html, encoding=None):
+    """Visible text of an HTML document; the one place the parser is chosen."""
+    from bs4 import BeautifulSoup # Deferred: only the Exa fallback path parses HTML
+    soup = BeautifulSoup(html, 'lxml', from_encoding=encoding) # C parser; much faster than html.parser
+    
+    # Kill all script and style elements to clean up text
+    for script in soup(["script", "style"]):
+        script.decompose()
+        
+    return soup.get_text(separator=' ', strip=True)
+
+EXA_FAILURE_TTL = 600 # Seconds to go straight to the fallback after Exa fails on a URL
+EXA_FAILURE_MAX = 256
+
+class FailureMemo:
+    """Thread-safe, bounded memo of recent failures; the least recent failure is evicted first."""
+
+    def __init__(self, ttl, max_entries):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._failed_at = {} # key -> time of last failure, least recent first
+        self._lock = threading.Lock()
+
+    def recently_failed(self, key):
+        with self._lock:
+            failed_at = self._failed_at.get(key)
+        return failed_at is not None and time.monotonic() - failed_at <= self.ttl
+
+    def record(self, key):
+        with self._lock:
+            self._failed_at.pop(key, None) # Re-insert so a repeat failure counts as newest
+            self._failed_at[key] = time.monotonic()
+            if len(self._failed_at) > self.max_entries:
+                del self._failed_at[next(iter(self._failed_at))]
+
+    def clear(self):
+        with self._lock:
+            self._failed_at.clear()
+
+@st.cache_resource
+def get_exa_failures():
+    """Recent Exa failures keyed on (API key hash, URL), shared across sessions."""
+    return FailureMemo(EXA_FAILURE_TTL, EXA_FAILURE_MAX)
+
 def run_compliance_crawl(url, api_key):
     """
-    Crawls URL via Exa. 
-    Falls back to BeautifulSoup if Exa fails.
+    Crawls URL via Exa and returns {"text", "truncated"}, where truncated means
+    the page hit the crawl size cap. Falls back to BeautifulSoup if Exa fails.
     """
     if not api_key:
         return None, "API Key Missing"
@@ -81,73 +278,136 @@ def run_compliance_crawl(url, api_key):
     if not url.startswith(("http://", "https://")):
         url = "https://" + url
 
-    # 2. Try Exa First (The "Smart" Way)
-    exa = Exa(api_key)
-    try:
-        response = exa.get_contents(ids=[url], text=True)
-        if response.results:
-            return response.results[0], None
-    except Exception as e:
-        # Just log error internally and move to fallback
-        print(f"Exa failed: {e}") 
+    # 2. Try Exa First (The "Smart" Way), unless it just failed on this URL with this key.
+    # Keyed per API key: one user's broken key mustn't push everyone else to the fallback.
+    key_hash = hash_api_key(api_key)
+    exa_failures = get_exa_failures()
+    if not exa_failures.recently_failed((key_hash, url)):
+        try:
+            pages = cached_exa_contents((url,), key_hash, api_key)
+            if pages:
+                text = pages[0]["text"]
+                return {"text": text, "truncated": len(text) >= EXA_MAX_CHARACTERS}, None
+        except (ValueError, requests.RequestException) as e:
+            # exa_py raises ValueError on non-200 replies; anything else is a bug and propagates.
+            # Log it, remember the miss so re-runs skip the Exa round-trip, and fall back
+            logger.warning("Exa failed for %s: %s", url, e)
+            exa_failures.record((key_hash, url))
 
     # 3. Fallback: BeautifulSoup (The "Manual" Way)
     try:
-        # Masquerade as a real browser to avoid 403 blocks
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.114 Safari/537.36"
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status() # Check for 404/403/500 errors
-        
-        soup = BeautifulSoup(response.text, 'html.parser')
-        
-        # Kill all script and style elements to clean up text
-        for script in soup(["script", "style"]):
-            script.decompose()
+        with get_http_session().get(url, timeout=10, stream=True) as response:
+            response.raise_for_status() # Check for 404/403/500 errors
             
-        text = soup.get_text(separator=' ', strip=True)
+            # Stream the (transparently gunzipped) body as bytes, capped so a huge page
+            # can't balloon memory; skips building a decoded response.text copy too
+            html = bytearray()
+            for chunk in response.iter_content(chunk_size=32_768):
+                html += chunk
+                if len(html) >= MAX_HTML_BYTES:
+                    break
+            
+            # Trust the server's charset only if it sent one; else let the parser sniff
+            content_type = response.headers.get("Content-Type", "").lower()
+            encoding = response.encoding if "charset=" in content_type else None
         
-        # Create a "Mock" object to match Exa's structure so the rest of the app doesn't break
-        class MockResult:
-            def __init__(self, text):
-                self.text = text
-                
-        return MockResult(text), None
+        return {"text": extract_text(bytes(html), encoding), "truncated": len(html) >= MAX_HTML_BYTES}, None
 
+    except requests.exceptions.SSLError:
+        # Certificates are always verified; say so plainly instead of dumping urllib3's trace
+        return None, f"Scraping Failed (Both Exa & Fallback): SSL certificate for {urlparse(url).netloc} could not be verified"
     except Exception as e:
         return None, f"Scraping Failed (Both Exa & Fallback): {str(e)}"
 
+# Prohibited keyword clusters, compiled once at import into a single matcher
+RISK_KEYWORDS = {
+    "Promissory / Guarantees": ["guaranteed return", "risk-free", "no loss", "guaranteed income"], 
+    "Unapproved Products": ["crypto", "private equity", "hedge fund", "bitcoin", "ethereum"], 
+    "Testimonials (SEC Rule)": ["reviews", "star rating", "5 stars", "testimonials"] 
+}
+KEYWORD_TO_CATEGORY = {kw.lower(): cat for cat, kws in RISK_KEYWORDS.items() for kw in kws}
+# Zero-width lookahead so overlapping keywords ("5 starstar rating") are all found, like a per-keyword scan
+RISK_RE = re.compile("(?=(" + "|".join(re.escape(kw) for kw in KEYWORD_TO_CATEGORY) + "))", re.IGNORECASE)
+# Part of the site-audit cache key, so editing the rules invalidates cached scans
+RISK_KEYWORDS_HASH = hashlib.blake2b(repr(RISK_KEYWORDS).encode(), digest_size=8).hexdigest()
+
 def analyze_risk_keywords(text):
-    """Scans text for prohibited keyword clusters."""
-    risk_keywords = {
-        "Promissory / Guarantees": ["guaranteed return", "risk-free", "no loss", "guaranteed income"], 
-        "Unapproved Products": ["crypto", "private equity", "hedge fund", "bitcoin", "ethereum"], 
-        "Testimonials (SEC Rule)": ["reviews", "star rating", "5 stars", "testimonials"] 
-    }
-    
-    found_risks = []
-    text_lower = text.lower()
+    """Scans text for prohibited keyword clusters in a single regex pass."""
+    # IGNORECASE folds per character, so no lowercased copy of the page is built
+    hits = set()
+    for match in RISK_RE.finditer(text):
+        keyword = match.group(1).lower()
+        if keyword not in KEYWORD_TO_CATEGORY:
+            continue # Case-fold variant (e.g. "riſk-free") the per-keyword scan never matched
+        hits.add(keyword)
+        if len(hits) == len(KEYWORD_TO_CATEGORY):
+            break # Every keyword already flagged; the rest of the page can't add any
     
-    for category, keywords in risk_keywords.items():
-        for keyword in keywords:
-            if keyword in text_lower:
-                found_risks.append(f"🔴 **{category}**: Found term '{keyword}'")
+    # Report in rule order, one flag per keyword (as the per-keyword scan did)
+    return [
+        f"🔴 **{category}**: Found term '{keyword}'"
+        for keyword, category in KEYWORD_TO_CATEGORY.items()
+        if keyword in hits
+    ]
+
+PREVIEW_CHARS = 2000 # Characters of site text shown in the content expander
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def cached_site_audit(url, keywords_hash, key_hash, _api_key):
+    """
+    Crawl + keyword scan as one cached step, so reruns skip the analysis too.
+    Failed crawls raise instead of returning, which keeps them out of the cache.
+    """
+    page, err = run_compliance_crawl(url, _api_key)
+    if page is None:
+        raise RuntimeError(err)
     
-    return found_risks
+    text = page["text"]
+    return {
+        "risk_flags": analyze_risk_keywords(text),
+        "preview": text[:PREVIEW_CHARS],
+        "truncated": page["truncated"], # Only part of the page was crawled & scanned
+        "scanned_chars": len(text),
+    }
+
+def run_site_audit(url, api_key):
+    """Crawls and scans the target website. Returns (report, error)."""
+    if not api_key:
+        return None, "API Key Missing"
+
+    try:
+        return cached_site_audit(url, RISK_KEYWORDS_HASH, hash_api_key(api_key), api_key), None
+    except RuntimeError as e:
+        return None, str(e)
 
 # --- UI & LOGIC ---
 
+def get_secret(name):
+    """Reads a key from st.secrets; None when there is no secrets.toml at all."""
+    try:
+        return st.secrets.get(name)
+    except FileNotFoundError:
+        return None
+
 # Sidebar for Inputs
 with st.sidebar:
     st.header("Investigation Controls")
     
-    # Secure Keys (Frictionless for user)
-    serpapi_key = st.secrets.get("SERPAPI_API_KEY")
-    exa_api_key = st.secrets.get("EXA_API_KEY")
+    # Secure Keys (Frictionless for user), with a manual fallback for local dev
+    serpapi_key = get_secret("SERPAPI_API_KEY") or st.text_input("SerpApi Key", type="password")
+    exa_api_key = get_secret("EXA_API_KEY") or st.text_input("Exa Key", type="password")
     
     if not (serpapi_key and exa_api_key):
-        st.error("⚠️ API Keys missing in secrets.toml!")
+        st.error("⚠️ API Keys missing! Add them to secrets.toml or enter them above.")
+
+    # Drop memoized SerpApi/Exa responses and Exa failures (e.g. after a site was updated)
+    if st.button("🧹 Clear Cached Results", use_container_width=True):
+        st.cache_data.clear()
+        get_exa_failures().clear()
+        st.toast("Cached search & crawl results cleared.")
+
+    # Read here, not in the workers: session state isn't reachable from executor threads
+    demo_pacing = st.toggle("🎬 Demo Pacing", value=True, help="Adds a realistic delay to the simulated CRM & FINRA checks.")
 
 col1, col2, col3 = st.columns([1, 1, 2])
 
@@ -166,43 +426,64 @@ if run_btn:
         st.warning("⚠️ Please provide Advisor Name, City, and the Target Website URL.")
         st.stop()
 
+    # Kick off every phase up front. The crawl target is user-supplied, so nothing
+    # depends on the search result, and the simulated checks' demo delay overlaps
+    # with real network I/O instead of running before it.
+    executor = ThreadPoolExecutor(max_workers=4)
+    internal_future = executor.submit(simulate_internal_discovery, demo_pacing)
+    reg_future = executor.submit(simulate_regulatory_check, demo_pacing)
+    search_future = executor.submit(run_google_test, advisor_name, city_loc, serpapi_key)
+    crawl_future = executor.submit(run_site_audit, target_url_input, exa_api_key)
+    executor.shutdown(wait=False) # Workers exit once all phases return
+
     # CONTAINER: Live Process Log
     with st.status("🕵️‍♂️ **Agent Active: Executing Zero-Touch Investigation...**", expanded=True) as status:
         
-        # 1. SIMULATION: Internal Data
-        st.write("📂 Accessing Internal CRM & Document Repository...")
-        internal_result = simulate_internal_discovery()
-        st.write(f"&nbsp;&nbsp;&nbsp;&nbsp;↳ {internal_result['detail']}")
-        
-        # 2. SIMULATION: Regulatory
-        st.write("⚖️ Querying FINRA / IAPD Databases...")
-        reg_result = simulate_regulatory_check()
-        st.write(f"&nbsp;&nbsp;&nbsp;&nbsp;↳ {reg_result['detail']}")
-
-        # 3. REAL: Google Search (Reputation Check)
-        st.write(f"🔍 Executing 'Google Test' for: *{advisor_name}*...")
-        search_data, search_err = run_google_test(advisor_name, city_loc, serpapi_key)
-        
-        if search_data and "organic_results" in search_data:
-            count = len(search_data["organic_results"])
-            st.write(f"&nbsp;&nbsp;&nbsp;&nbsp;✅ Found {count} reputation signals.")
-        else:
-            st.write(f"&nbsp;&nbsp;&nbsp;&nbsp;⚠️ Google Search returned no results (Continuing to website audit...)")
+        # One log slot per phase, in the usual order. Each slot fills in as soon as its
+        # phase finishes, so a fast (e.g. cached) phase isn't held behind a slow one.
+        internal_log, reg_log, search_log, crawl_log = (st.container() for _ in range(4))
+        internal_log.write("📂 Accessing Internal CRM & Document Repository...")
+        reg_log.write("⚖️ Querying FINRA / IAPD Databases...")
+        search_log.write(f"🔍 Executing 'Google Test' for: *{advisor_name}*...")
+        crawl_log.write(f"🕷️ Deploying Exa Crawler to Target: *{target_url_input}*...")
 
-        # 4. REAL: Website Crawl (Manual Input)
-        st.write(f"🕷️ Deploying Exa Crawler to Target: *{target_url_input}*...")
-        crawl_data, crawl_err = run_compliance_crawl(target_url_input, exa_api_key)
-        
-        risk_flags = []
-        if crawl_data:
-            st.write("&nbsp;&nbsp;&nbsp;&nbsp;✅ Content Extracted Successfully. Analyzing text stream...")
-            risk_flags = analyze_risk_keywords(crawl_data.text)
-            if risk_flags:
-                st.write(f"&nbsp;&nbsp;&nbsp;&nbsp;⚠️ **{len(risk_flags)} Compliance Risks Detected.**")
+        for future in as_completed([internal_future, reg_future, search_future, crawl_future]):
+            # 1. SIMULATION: Internal Data
+            if future is internal_future:
+                internal_result = future.result()
+                internal_log.write(f"&nbsp;&nbsp;&nbsp;&nbsp;↳ {internal_result['detail']}")
+            
+            # 2. SIMULATION: Regulatory
+            elif future is reg_future:
+                reg_result = future.result()
+                reg_log.write(f"&nbsp;&nbsp;&nbsp;&nbsp;↳ {reg_result['detail']}")
+
+            # 3. REAL: Google Search (Reputation Check)
+            elif future is search_future:
+                search_data, search_err = future.result()
+                
+                if search_data and search_data["organic_results"]:
+                    count = len(search_data["organic_results"])
+                    search_log.write(f"&nbsp;&nbsp;&nbsp;&nbsp;✅ Found {count} reputation signals.")
+                else:
+                    search_log.write(f"&nbsp;&nbsp;&nbsp;&nbsp;⚠️ Google Search returned no results (Continuing to website audit...)")
+
+            # 4. REAL: Website Crawl (Manual Input)
             else:
-                st.write("&nbsp;&nbsp;&nbsp;&nbsp;✅ No Keyword Risks Detected.")
-        else:
-            st.write(f"&nbsp;&nbsp;&nbsp;&nbsp;❌ Crawl Failed: {crawl_err}")
+                site_report, crawl_err = future.result()
+                
+                risk_flags = []
+                if site_report:
+                    crawl_log.write("&nbsp;&nbsp;&nbsp;&nbsp;✅ Content Extracted Successfully. Analyzing text stream...")
+                    risk_flags = site_report["risk_flags"]
+                    if risk_flags:
+                        crawl_log.write(f"&nbsp;&nbsp;&nbsp;&nbsp;⚠️ **{len(risk_flags)} Compliance Risks Detected.**")
+                    elif site_report["truncated"]:
+                        crawl_log.write("&nbsp;&nbsp;&nbsp;&nbsp;⚠️ No Keyword Risks in the scanned portion (page truncated; partial scan).")
+                    else:
+                        crawl_log.write("&nbsp;&nbsp;&nbsp;&nbsp;✅ No Keyword Risks Detected.")
+                else:
+                    crawl_log.write(f"&nbsp;&nbsp;&nbsp;&nbsp;❌ Crawl Failed: {crawl_err}")
 
         status.update(label="✅ Pre-Audit Investigation Complete", state="complete")
 
@@ -216,14 +497,18 @@ if run_btn:
         st.subheader("🌐 Digital Footprint")
         st.caption(f"Reputation Check: {advisor_name} ({city_loc})")
         
-        if search_data and "organic_results" in search_data:
+        if search_data and search_data["organic_results"]:
+            cards = []
             for res in search_data["organic_results"][:4]:
-                with st.container(border=True):
-                    st.markdown(f"**[{res.get('title')}]({res.get('link')})**")
-                    st.caption(res.get("snippet"))
-                    
-                    if "linkedin" in res.get("link", ""):
-                        st.info("ℹ️ **OBA Check**: Verify this LinkedIn profile matches CRM records.")
+                card = f"**[{res.get('title')}]({res.get('link')})**\n\n{res.get('snippet') or ''}"
+                
+                if res["oba_check"]:
+                    card += "\n\n> ℹ️ **OBA Check**: Verify this LinkedIn profile matches CRM records."
+                cards.append(card)
+            
+            # One container + one markdown element, rather than 3-4 widgets per result
+            with st.container(border=True):
+                st.markdown("\n\n---\n\n".join(cards))
         elif search_err:
              st.error(f"Search API Error: {search_err}")
         else:
@@ -243,18 +528,24 @@ if run_btn:
         st.subheader("📝 Website Compliance Audit")
         st.caption(f"Source: {target_url_input}")
         
-        if crawl_data:
+        if site_report:
             # 1. Risk Flags Section
             if risk_flags:
                 st.error(f"🚩 **{len(risk_flags)} Potential Violations Detected**")
                 for flag in risk_flags:
                     st.markdown(f"- {flag}")
+            elif site_report["truncated"]:
+                # Never report a clean result for text we didn't see
+                st.warning("⚠️ **Partial Scan**: No prohibited keywords found in the scanned portion, but the page was truncated.")
             else:
                 st.success("✅ Clean Scan: No prohibited keywords found.")
+            
+            if site_report["truncated"]:
+                st.caption(f"Page exceeded the crawl size limit; only the first {site_report['scanned_chars']:,} characters were scanned.")
 
             # 2. Content Preview Section
             with st.expander("📄 View Scraped Site Content", expanded=False):
-                st.text(crawl_data.text[:2000] + "...")
+                st.text(site_report["preview"] + "...")
                 st.caption("... (Truncated for view) ...")
         else:
             st.warning("Website content could not be analyzed. Check the URL and try again.")